@@ -2,16 +2,19 @@
 from __future__ import annotations
 
 import argparse
-import csv
+import hashlib
 import json
 import math
+import os
 import random
+import re
 import subprocess
 import sys
 import time
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 SCALE_KEYS = [
     "risk_weight_scale",
@@ -59,6 +62,38 @@ DELTA_KEY = "min_fire_quality_delta"
 DELTA_BOUNDS = (-0.35, 0.3)
 PROFILE_KEYS = SCALE_KEYS + [DELTA_KEY]
 
+# Index-aligned views of the bounds so profile math can run over flat vectors
+# (one float per PROFILE_KEYS entry) instead of per-key dict lookups.
+KEY_INDEX: Dict[str, int] = {key: idx for idx, key in enumerate(PROFILE_KEYS)}
+DELTA_INDEX = KEY_INDEX[DELTA_KEY]
+BOUNDS_LO: List[float] = [SCALE_BOUNDS[key][0] for key in SCALE_KEYS] + [DELTA_BOUNDS[0]]
+BOUNDS_HI: List[float] = [SCALE_BOUNDS[key][1] for key in SCALE_KEYS] + [DELTA_BOUNDS[1]]
+PROFILE_BOUNDS: List[Tuple[float, float]] = list(zip(BOUNDS_LO, BOUNDS_HI))
+PROFILE_DEFAULTS: List[float] = [1.0] * len(SCALE_KEYS) + [0.0]
+
+# Profiles are carried as PROFILE_KEYS-ordered tuples; they are hashable, so
+# they double as their own signature. Dicts only exist at the JSON boundary.
+# Every ProfileVec returned by the helpers below is already clamped and
+# rounded, so callers never need to re-normalize one.
+ProfileVec = Tuple[float, ...]
+
+# Power-law mutation (fast-GA style): tail exponents for the number of mutated
+# fields and for each field's step multiplier, and a cap on one field's relative
+# change. With these values a mutation usually touches min_fields (~65%) and
+# moves each field by about one step on average; ~8% of moves exceed two steps.
+FIELD_COUNT_BETA = 2.5
+JUMP_BETA = 3.0
+MAX_JUMP = 0.9
+
+# `rust-autopilot benchmark` prints one RESULT line per bot (and per profile in
+# --profiles-dir batch mode) after the run.
+RESULT_LINE = re.compile(
+    r"^RESULT (?:profile=(?P<profile>\S+) )?bot=(?P<bot>\S+) "
+    r"objective=(?P<objective>\S+) avg_score=(?P<avg_score>\S+) "
+    r"max_score=(?P<max_score>\d+) avg_frames=(?P<avg_frames>\S+)$",
+    re.MULTILINE,
+)
+
 
 @dataclass
 class CandidateResult:
@@ -70,40 +105,97 @@ class CandidateResult:
     max_score: int
     avg_frames: float
     out_dir: str
-    profile: Dict[str, float]
+    profile: ProfileVec
+    error: str = ""
+
+
+def load_eval_cache(
+    path: Path, context: Dict[str, object]
+) -> Dict[ProfileVec, CandidateResult]:
+    data = load_json(path)
+    if data.get("context") != context:
+        print(f"Ignoring eval cache with mismatched context: {path}", flush=True)
+        return {}
+    cache: Dict[ProfileVec, CandidateResult] = {}
+    for entry in data.get("entries", []):
+        entry = dict(entry)
+        entry["profile"] = profile_from_dict(entry["profile"])
+        result = CandidateResult(**entry)
+        cache[profile_signature(result.profile)] = result
+    return cache
+
+
+def write_eval_cache(
+    path: Path, context: Dict[str, object], cache: Dict[ProfileVec, CandidateResult]
+) -> None:
+    write_json(
+        path,
+        {
+            "context": context,
+            "entries": [
+                {**asdict(result), "profile": profile_to_dict(result.profile)}
+                for result in cache.values()
+            ],
+        },
+        indent=None,
+    )
 
 
-def run_cmd(cmd: List[str], cwd: Path) -> None:
+def run_cmd_verbose(cmd: List[str], cwd: Path) -> None:
     display = " ".join(cmd)
     print(f"$ {display}", flush=True)
-    subprocess.run(cmd, cwd=str(cwd), check=True)
+    subprocess.run(cmd, cwd=cwd, check=True)
+
+
+def run_cmd_quiet(
+    cmd: List[str], cwd: Path, check: bool = True
+) -> subprocess.CompletedProcess:
+    """Hot-path runner: no echo, stdout/stderr captured for the caller."""
+    return subprocess.run(cmd, cwd=cwd, check=check, capture_output=True, text=True)
 
 
 def load_json(path: Path) -> Dict:
     return json.loads(path.read_text())
 
 
-def write_json(path: Path, data: Dict) -> None:
+def write_json(
+    path: Path, data: Dict, atomic: bool = False, indent: int | None = 2
+) -> None:
+    """indent=None writes compact JSON for machine-only artifacts."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2) + "\n")
+    text = json.dumps(data, indent=indent) + "\n"
+    if not atomic:
+        path.write_text(text)
+        return
+    # Write-then-rename so readers never observe a half-written file.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
 
 
 def clamp(value: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, value))
 
 
-def normalize_profile(profile: Dict[str, float]) -> Dict[str, float]:
-    out = {}
-    for key in SCALE_KEYS:
-        lo, hi = SCALE_BOUNDS[key]
-        out[key] = round(clamp(float(profile.get(key, 1.0)), lo, hi), 6)
-    out[DELTA_KEY] = round(clamp(float(profile.get(DELTA_KEY, 0.0)), *DELTA_BOUNDS), 6)
-    return out
+def normalize_profile(vec: Sequence[float]) -> ProfileVec:
+    # Hot path: clamp inlined, bounds read positionally from PROFILE_BOUNDS.
+    return tuple(
+        [round(min(hi, max(lo, float(v))), 6) for v, (lo, hi) in zip(vec, PROFILE_BOUNDS)]
+    )
+
+
+def profile_from_dict(profile: Dict[str, float]) -> ProfileVec:
+    return normalize_profile(
+        [profile.get(key, default) for key, default in zip(PROFILE_KEYS, PROFILE_DEFAULTS)]
+    )
 
 
-def profile_signature(profile: Dict[str, float]) -> str:
-    normalized = normalize_profile(profile)
-    return json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+def profile_to_dict(vec: ProfileVec) -> Dict[str, float]:
+    return dict(zip(PROFILE_KEYS, vec))
+
+
+def profile_signature(vec: ProfileVec) -> ProfileVec:
+    return vec
 
 
 def metric_tuple(
@@ -139,41 +231,53 @@ def better_than(
     return metric_tuple(left, selection_metric) > metric_tuple(right, selection_metric)
 
 
+def metropolis_accept(delta: float, temperature: float, rng: random.Random) -> bool:
+    """Accept a non-improving move with probability exp(delta / T)."""
+    if temperature <= 0.0 or not math.isfinite(delta):
+        return False
+    if delta >= 0.0:
+        return True
+    return rng.random() < math.exp(delta / max(temperature, 1e-9))
+
+
+def power_law_draw(rng: random.Random, beta: float) -> float:
+    """Sample alpha >= 1 with P(alpha >= x) = x^-(beta - 1)."""
+    return (1.0 - rng.random()) ** (-1.0 / (beta - 1.0))
+
+
 def mutate_profile(
-    base: Dict[str, float],
+    base: ProfileVec,
     rng: random.Random,
     step: float,
     min_fields: int = 3,
     max_fields: int = 7,
     delta_scale: float = 0.1,
-) -> Dict[str, float]:
-    out = dict(base)
+) -> ProfileVec:
+    vec = list(base)
 
     min_fields = max(1, min(min_fields, len(SCALE_KEYS)))
     max_fields = max(min_fields, min(max_fields, len(SCALE_KEYS)))
-    field_count = rng.randint(min_fields, max_fields)
+    field_count = min(max_fields, min_fields - 1 + int(power_law_draw(rng, FIELD_COUNT_BETA)))
 
-    for key in rng.sample(SCALE_KEYS, field_count):
-        lo, hi = SCALE_BOUNDS[key]
-        factor = 1.0 + rng.uniform(-step, step)
-        out[key] = clamp(float(out[key]) * factor, lo, hi)
+    # Heavy-tailed step sizes: about one step on average, occasionally a long jump.
+    for idx in rng.sample(range(len(SCALE_KEYS)), field_count):
+        magnitude = min(rng.uniform(0.0, step) * power_law_draw(rng, JUMP_BETA), MAX_JUMP)
+        vec[idx] *= 1.0 + rng.choice((-1.0, 1.0)) * magnitude
 
     if rng.random() < 0.95:
         delta_step = max(0.01, step * delta_scale)
-        out[DELTA_KEY] = clamp(
-            float(out[DELTA_KEY]) + rng.uniform(-delta_step, delta_step),
-            *DELTA_BOUNDS,
-        )
+        vec[DELTA_INDEX] += rng.uniform(-delta_step, delta_step)
 
-    return normalize_profile(out)
+    return normalize_profile(vec)
 
 
 def mutate_profile_aggressive(
-    base: Dict[str, float],
+    base: ProfileVec,
     rng: random.Random,
     step: float,
-) -> Dict[str, float]:
-    out = mutate_profile(
+) -> ProfileVec:
+    # The power-law jumps in mutate_profile cover the old forced hard resets.
+    return mutate_profile(
         base,
         rng,
         step=step * 1.75,
@@ -182,56 +286,88 @@ def mutate_profile_aggressive(
         delta_scale=0.2,
     )
 
-    # Occasionally force one hard reset to escape local plateaus.
-    if rng.random() < 0.45:
-        key = rng.choice(SCALE_KEYS)
-        lo, hi = SCALE_BOUNDS[key]
-        out[key] = round(rng.uniform(lo, hi), 6)
 
-    return normalize_profile(out)
-
-
-def blend_profiles(a: Dict[str, float], b: Dict[str, float], alpha: float) -> Dict[str, float]:
+def blend_profiles(a: ProfileVec, b: ProfileVec, alpha: float) -> ProfileVec:
     alpha = clamp(alpha, 0.0, 1.0)
-    out = {}
-    for key in SCALE_KEYS:
-        lo, hi = SCALE_BOUNDS[key]
-        value = float(a[key]) * alpha + float(b[key]) * (1.0 - alpha)
-        out[key] = round(clamp(value, lo, hi), 6)
-    delta_value = float(a[DELTA_KEY]) * alpha + float(b[DELTA_KEY]) * (1.0 - alpha)
-    out[DELTA_KEY] = round(clamp(delta_value, *DELTA_BOUNDS), 6)
-    return normalize_profile(out)
+    beta = 1.0 - alpha
+    return normalize_profile([x * alpha + y * beta for x, y in zip(a, b)])
 
 
-def profile_delta(newer: Dict[str, float], older: Dict[str, float]) -> Dict[str, float]:
-    out = {}
-    for key in PROFILE_KEYS:
-        out[key] = round(float(newer[key]) - float(older[key]), 6)
-    return out
+def profile_delta(newer: ProfileVec, older: ProfileVec) -> ProfileVec:
+    return tuple(round(x - y, 6) for x, y in zip(newer, older))
 
 
 def apply_momentum(
-    base: Dict[str, float],
-    momentum: Dict[str, float],
+    base: ProfileVec,
+    momentum: ProfileVec,
     scale: float,
-) -> Dict[str, float]:
-    out = dict(base)
-    for key in SCALE_KEYS:
-        lo, hi = SCALE_BOUNDS[key]
-        out[key] = clamp(float(out[key]) + float(momentum.get(key, 0.0)) * scale, lo, hi)
-    out[DELTA_KEY] = clamp(
-        float(out[DELTA_KEY]) + float(momentum.get(DELTA_KEY, 0.0)) * scale,
-        *DELTA_BOUNDS,
+) -> ProfileVec:
+    return normalize_profile([x + d * scale for x, d in zip(base, momentum)])
+
+
+def newest_input_mtime(autopilot_root: Path, bin_path: Path) -> float:
+    """Newest mtime among the inputs cargo recorded for bin_path (inf if unknown)."""
+    # cargo's dep-info lists exactly the sources the build read, path dependencies
+    # included, so files cargo ignores cannot make the binary look stale forever.
+    # It omits the manifest and lock file, so add this crate's own: a dependency
+    # bump or `cargo update` must still trigger a rebuild.
+    dep_info = bin_path.with_suffix(".d")
+    if not dep_info.exists():
+        return math.inf
+    newest = 0.0
+    for manifest in (autopilot_root / "Cargo.toml", autopilot_root / "Cargo.lock"):
+        if manifest.exists():
+            newest = max(newest, manifest.stat().st_mtime)
+    for line in dep_info.read_text().splitlines():
+        _, sep, deps = line.partition(": ")
+        if not sep or line.startswith("#"):
+            continue
+        for raw in re.split(r"(?<!\\) ", deps.strip()):
+            if not raw:
+                continue
+            path = Path(raw.replace("\\ ", " "))
+            if not path.exists():
+                return math.inf
+            newest = max(newest, path.stat().st_mtime)
+    return newest
+
+
+def surrogate_rank(
+    pool: List[ProfileVec],
+    observed: List[Tuple[ProfileVec, float]],
+    kappa: float,
+    random_seed: int,
+) -> List[ProfileVec]:
+    """Order pool by GP upper confidence bound (mu + kappa * sigma), best first."""
+    import numpy as np
+    from sklearn.gaussian_process import GaussianProcessRegressor
+    from sklearn.gaussian_process.kernels import Matern
+
+    lo = np.array(BOUNDS_LO)
+    span = np.array(BOUNDS_HI) - lo
+    x_train = (np.array([vec for vec, _ in observed]) - lo) / span
+    y_train = np.array([value for _, value in observed])
+    x_pool = (np.array(pool) - lo) / span
+
+    gp = GaussianProcessRegressor(
+        # Inputs are rescaled to [0, 1], so keep length scales in a sane range.
+        kernel=Matern(length_scale=0.5, length_scale_bounds=(1e-2, 1e2), nu=2.5),
+        normalize_y=True,
+        n_restarts_optimizer=2,
+        random_state=random_seed,
     )
-    return normalize_profile(out)
+    gp.fit(x_train, y_train)
+    mu, sigma = gp.predict(x_pool, return_std=True)
+    ucb = mu + kappa * sigma
+    return [pool[idx] for idx in np.argsort(-ucb, kind="stable")]
 
 
 def ensure_binary(autopilot_root: Path) -> Path:
     bin_path = autopilot_root / "target" / "release" / "rust-autopilot"
-    if bin_path.exists():
+    if bin_path.exists() and bin_path.stat().st_mtime >= newest_input_mtime(autopilot_root, bin_path):
         return bin_path
 
-    run_cmd(
+    run_cmd_verbose(
         [
             "cargo",
             "build",
@@ -255,13 +391,16 @@ def benchmark_profile(
     max_frames: int,
     jobs: int,
     out_dir: Path,
+    profile_path: Path,
 ) -> Tuple[float, float, int, float]:
-    run_cmd(
+    proc = run_cmd_quiet(
         [
             str(binary),
             "benchmark",
             "--bots",
             bot,
+            "--adaptive-profile",
+            str(profile_path),
             "--seed-file",
             str(seeds_file),
             "--max-frames",
@@ -278,52 +417,80 @@ def benchmark_profile(
         cwd=autopilot_root,
     )
 
-    summary = load_json(out_dir / "summary.json")
-    ranking = None
-    for item in summary.get("bot_rankings", []):
-        if item.get("bot_id") == bot:
-            ranking = item
-            break
-
-    if ranking is None:
-        raise RuntimeError(f"bot '{bot}' not found in {out_dir / 'summary.json'}")
-
-    return (
-        float(ranking["objective_value"]),
-        float(ranking["avg_score"]),
-        int(ranking["max_score"]),
-        float(ranking["avg_frames"]),
+    for match in RESULT_LINE.finditer(proc.stdout):
+        if match["bot"] == bot:
+            return (
+                float(match["objective"]),
+                float(match["avg_score"]),
+                int(match["max_score"]),
+                float(match["avg_frames"]),
+            )
+
+    raise RuntimeError(f"no RESULT line for bot '{bot}' in benchmark output ({out_dir})")
+
+
+def benchmark_profile_batch(
+    binary: Path,
+    autopilot_root: Path,
+    bot: str,
+    seeds_file: Path,
+    max_frames: int,
+    jobs: int,
+    profiles_dir: Path,
+    out_dir: Path,
+) -> Tuple[Dict[str, Tuple[float, float, int, float]], str]:
+    """Benchmark every profile in profiles_dir with one binary invocation.
+
+    Returns metrics keyed by profile file stem (profiles that failed are
+    missing) plus the captured stderr.
+    """
+    proc = run_cmd_quiet(
+        [
+            str(binary),
+            "benchmark",
+            "--bots",
+            bot,
+            "--profiles-dir",
+            str(profiles_dir),
+            "--seed-file",
+            str(seeds_file),
+            "--max-frames",
+            str(max_frames),
+            "--objective",
+            "score",
+            "--save-top",
+            "1",
+            "--jobs",
+            str(jobs),
+            "--out-dir",
+            str(out_dir),
+        ],
+        cwd=autopilot_root,
+        check=False,
     )
 
+    metrics: Dict[str, Tuple[float, float, int, float]] = {}
+    for match in RESULT_LINE.finditer(proc.stdout):
+        if match["bot"] == bot and match["profile"]:
+            metrics[match["profile"]] = (
+                float(match["objective"]),
+                float(match["avg_score"]),
+                int(match["max_score"]),
+                float(match["avg_frames"]),
+            )
+    error = proc.stderr.strip() or f"exit status {proc.returncode}"
+    return metrics, error
+
 
 def write_leaderboard(path: Path, results: List[CandidateResult]) -> None:
-    with path.open("w", newline="") as handle:
-        writer = csv.writer(handle)
-        writer.writerow(
-            [
-                "iteration",
-                "candidate",
-                "strategy",
-                "objective_value",
-                "avg_score",
-                "max_score",
-                "avg_frames",
-                "out_dir",
-            ]
-        )
-        for row in results:
-            writer.writerow(
-                [
-                    row.iteration,
-                    row.candidate,
-                    row.strategy,
-                    f"{row.objective_value:.6f}",
-                    f"{row.avg_score:.6f}",
-                    row.max_score,
-                    f"{row.avg_frames:.6f}",
-                    row.out_dir,
-                ]
-            )
+    # Fields never contain commas or quotes, so plain joins are valid CSV.
+    lines = ["iteration,candidate,strategy,objective_value,avg_score,max_score,avg_frames,out_dir"]
+    lines.extend(
+        f"{row.iteration},{row.candidate},{row.strategy},{row.objective_value:.6f},"
+        f"{row.avg_score:.6f},{row.max_score},{row.avg_frames:.6f},{row.out_dir}"
+        for row in results
+    )
+    path.write_text("\n".join(lines) + "\n")
 
 
 def parse_args() -> argparse.Namespace:
@@ -334,6 +501,17 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--candidates", type=int, default=6)
     parser.add_argument("--max-frames", type=int, default=108_000)
     parser.add_argument("--jobs", type=int, default=8)
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Benchmark each iteration's candidates in a single binary invocation (ignores --workers)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Candidates benchmarked concurrently (0=auto: cpu_count // jobs)",
+    )
     parser.add_argument("--bot", default="codex-potential-adaptive")
     parser.add_argument(
         "--seeds-file",
@@ -343,12 +521,24 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--initial-step", type=float, default=0.18)
     parser.add_argument("--decay", type=float, default=0.86)
     parser.add_argument("--min-step", type=float, default=0.04)
+    parser.add_argument(
+        "--initial-temp",
+        type=float,
+        default=0.0,
+        help="Simulated-annealing start temperature in selection-metric units (0=pure hill climb)",
+    )
+    parser.add_argument("--cooling", type=float, default=0.9)
     parser.add_argument(
         "--install-mode",
         choices=["champion", "restore"],
         default="champion",
         help="champion=install session best into active profile, restore=restore previous active profile",
     )
+    parser.add_argument(
+        "--eval-cache",
+        default="",
+        help="Optional eval-cache.json from an earlier session to reuse benchmark results from",
+    )
     parser.add_argument(
         "--start-profile",
         default="",
@@ -360,6 +550,27 @@ def parse_args() -> argparse.Namespace:
         default="core",
         help="core=base/champion anchors, all=core + auto champion-* archives",
     )
+    parser.add_argument(
+        "--strategy",
+        choices=["mixed", "cma"],
+        default="mixed",
+        help="mixed=momentum/blend/mutate heuristics, cma=CMA-ES population (requires the cma package)",
+    )
+    parser.add_argument(
+        "--early-stop",
+        type=int,
+        default=0,
+        help="Cancel an iteration's remaining benchmarks after N candidates in a row fail to "
+        "improve on the best so far (0=off; ignored with --strategy cma and --batch)",
+    )
+    parser.add_argument("--improvement-epsilon", type=float, default=0.0)
+    parser.add_argument(
+        "--surrogate",
+        action="store_true",
+        help="Screen mutation candidates with a Gaussian-process UCB surrogate (requires scikit-learn)",
+    )
+    parser.add_argument("--surrogate-pool", type=int, default=1024)
+    parser.add_argument("--surrogate-kappa", type=float, default=1.96)
     parser.add_argument(
         "--selection-metric",
         choices=["objective", "score", "insane"],
@@ -378,6 +589,49 @@ def main() -> int:
         raise ValueError("--candidates must be >= 2")
     if args.max_frames < 1:
         raise ValueError("--max-frames must be >= 1")
+    if args.jobs < 1:
+        raise ValueError("--jobs must be >= 1")
+    if args.workers < 0:
+        raise ValueError("--workers must be >= 0")
+    if args.initial_temp < 0.0:
+        raise ValueError("--initial-temp must be >= 0")
+    if not 0.0 < args.cooling <= 1.0:
+        raise ValueError("--cooling must be in (0, 1]")
+
+    if args.strategy == "cma":
+        try:
+            import cma
+        except ImportError as exc:
+            raise RuntimeError(
+                "--strategy cma requires the 'cma' package (pip install cma)"
+            ) from exc
+
+    if args.early_stop < 0:
+        raise ValueError("--early-stop must be >= 0")
+    # CMA-ES needs every population member scored, and a batch is a single call.
+    early_stop = 0 if args.strategy == "cma" or args.batch else args.early_stop
+
+    def beats_by_epsilon(left: CandidateResult, right: CandidateResult) -> bool:
+        margin = (
+            metric_tuple(left, args.selection_metric)[0]
+            - metric_tuple(right, args.selection_metric)[0]
+        )
+        if not better_than(left, right, args.selection_metric):
+            return False
+        return margin >= args.improvement_epsilon
+
+    if args.surrogate:
+        if args.surrogate_pool < args.candidates:
+            raise ValueError("--surrogate-pool must be >= --candidates")
+        try:
+            import sklearn  # noqa: F401
+        except ImportError as exc:
+            raise RuntimeError(
+                "--surrogate requires scikit-learn (pip install scikit-learn)"
+            ) from exc
+
+    workers = args.workers or max(1, (os.cpu_count() or 1) // args.jobs)
+    workers = min(workers, args.candidates)
 
     autopilot_root = Path(__file__).resolve().parents[2]
     lab_root = autopilot_root / "codex-tuner"
@@ -397,14 +651,17 @@ def main() -> int:
         raise FileNotFoundError(f"base profile not found: {base_profile_path}")
     if not active_profile_path.exists():
         seed_source = champion_profile_path if champion_profile_path.exists() else base_profile_path
-        write_json(active_profile_path, normalize_profile(load_json(seed_source)))
+        seed_profile = profile_from_dict(load_json(seed_source))
+        write_json(active_profile_path, profile_to_dict(seed_profile), atomic=True)
 
     session_name = time.strftime("session-%Y%m%d-%H%M%S", time.gmtime())
     session_dir = lab_root / "runs" / session_name
     session_dir.mkdir(parents=True, exist_ok=False)
 
-    old_profile = normalize_profile(load_json(active_profile_path))
-    write_json(session_dir / "backup-active-profile.json", old_profile)
+    old_profile = profile_from_dict(load_json(active_profile_path))
+    write_json(
+        session_dir / "backup-active-profile.json", profile_to_dict(old_profile), indent=None
+    )
 
     rng = random.Random(args.random_seed)
     if args.start_profile.strip():
@@ -419,11 +676,11 @@ def main() -> int:
     else:
         start_profile_path = base_profile_path
 
-    incumbent_profile = normalize_profile(load_json(start_profile_path))
-    global_best_profile = dict(incumbent_profile)
+    incumbent_profile = profile_from_dict(load_json(start_profile_path))
+    global_best_profile = incumbent_profile
     global_best_result: CandidateResult | None = None
     incumbent_sig = profile_signature(incumbent_profile)
-    anchor_profiles: List[Tuple[str, Dict[str, float]]] = []
+    anchor_profiles: List[Tuple[str, ProfileVec]] = []
     anchor_source_pairs: List[Tuple[str, Path]] = [
         ("base", base_profile_path),
         ("champion", champion_profile_path),
@@ -443,20 +700,57 @@ def main() -> int:
     for label, path in anchor_source_pairs:
         if not path.exists():
             continue
-        profile = normalize_profile(load_json(path))
+        profile = profile_from_dict(load_json(path))
         if profile_signature(profile) == incumbent_sig:
             continue
         anchor_profiles.append((label, profile))
 
-    momentum: Dict[str, float] | None = None
-    last_gain_anchor: Dict[str, float] | None = None
+    binary = ensure_binary(autopilot_root)
+
+    # Benchmarks are deterministic for a fixed binary/bot/seed set/frame cap, so
+    # any profile scored under the same context can be reused instead of re-run.
+    eval_cache_context: Dict[str, object] = {
+        "bot": args.bot,
+        "seeds_file": str(seeds_file),
+        "seeds_sha256": hashlib.sha256(seeds_file.read_bytes()).hexdigest(),
+        "max_frames": args.max_frames,
+        "binary_mtime_ns": binary.stat().st_mtime_ns,
+    }
+    eval_cache: Dict[ProfileVec, CandidateResult] = {}
+    if args.eval_cache.strip():
+        eval_cache_path = Path(args.eval_cache)
+        if not eval_cache_path.is_absolute():
+            eval_cache_path = (autopilot_root / eval_cache_path).resolve()
+        if not eval_cache_path.exists():
+            raise FileNotFoundError(f"eval cache not found: {eval_cache_path}")
+        eval_cache = load_eval_cache(eval_cache_path, eval_cache_context)
+
+    # Scores of the current incumbent; carried across iterations so it is never
+    # benchmarked twice.
+    incumbent_record = eval_cache.get(profile_signature(incumbent_profile))
+
+    momentum: ProfileVec | None = None
+    last_gain_anchor: ProfileVec | None = None
     stagnation_count = 0
     history: List[Dict] = []
 
-    binary = ensure_binary(autopilot_root)
     print(f"Using binary: {binary}")
     print(f"Session dir: {session_dir}")
     print(f"Start profile: {start_profile_path}")
+    print(f"Workers: {workers} x jobs={args.jobs}")
+
+    es = None
+    if args.strategy == "cma":
+        es = cma.CMAEvolutionStrategy(
+            list(incumbent_profile),
+            args.initial_step,
+            {
+                "bounds": [BOUNDS_LO, BOUNDS_HI],
+                "popsize": args.candidates,
+                "seed": args.random_seed,
+                "verbose": -9,
+            },
+        )
 
     success = False
     try:
@@ -465,20 +759,45 @@ def main() -> int:
             iter_dir.mkdir(parents=True, exist_ok=True)
 
             base_step = max(args.min_step, args.initial_step * (args.decay ** (iteration - 1)))
+            temperature = args.initial_temp * (args.cooling ** (iteration - 1))
             search_step = min(base_step * (1.0 + 0.3 * stagnation_count), base_step * 2.4)
 
-            candidate_specs: List[Tuple[Dict[str, float], str]] = []
-            seen: set[str] = set()
+            candidate_specs: List[Tuple[ProfileVec, str]] = []
+            seen: set[ProfileVec] = set()
 
-            def push_candidate(profile: Dict[str, float], strategy: str) -> bool:
-                normalized = normalize_profile(profile)
-                sig = profile_signature(normalized)
+            def push_candidate(profile: ProfileVec, strategy: str) -> bool:
+                sig = profile_signature(profile)
                 if sig in seen:
                     return False
+                if (
+                    stagnation_count == 0
+                    and incumbent_record is not None
+                    and strategy != "incumbent"
+                ):
+                    # Fresh incumbent: spend the slot on something new rather than
+                    # replaying a profile already known to lose to it.
+                    cached = eval_cache.get(sig)
+                    if cached is not None and not better_than(
+                        cached, incumbent_record, args.selection_metric
+                    ):
+                        return False
                 seen.add(sig)
-                candidate_specs.append((normalized, strategy))
+                candidate_specs.append((profile, strategy))
                 return True
 
+            cma_solutions: List[List[float]] = []
+            if es is not None:
+                # The CMA population is the iteration's candidate set; the incumbent is
+                # injected so it is always re-scored alongside the samples.
+                es.inject([list(incumbent_profile)], force=True)
+                cma_solutions = es.ask()
+                for solution in cma_solutions:
+                    profile = normalize_profile(solution)
+                    incumbent_hit = profile == incumbent_profile and incumbent_profile not in seen
+                    seen.add(profile)
+                    candidate_specs.append((profile, "incumbent" if incumbent_hit else "cma"))
+
+            # No-op under CMA unless the injected incumbent was not returned verbatim.
             push_candidate(incumbent_profile, "incumbent")
 
             if momentum is not None and len(candidate_specs) < args.candidates:
@@ -531,18 +850,16 @@ def main() -> int:
                 )
 
             if args.selection_metric == "insane" and len(candidate_specs) < args.candidates:
-                chaos = mutate_profile_aggressive(incumbent_profile, rng, search_step * 1.45)
+                chaos = list(mutate_profile_aggressive(incumbent_profile, rng, search_step * 1.45))
                 if rng.random() < 0.72:
-                    for key in rng.sample(SCALE_KEYS, rng.randint(1, 3)):
-                        lo, hi = SCALE_BOUNDS[key]
-                        chaos[key] = round(rng.uniform(lo, hi), 6)
+                    for idx in rng.sample(range(len(SCALE_KEYS)), rng.randint(1, 3)):
+                        chaos[idx] = round(rng.uniform(BOUNDS_LO[idx], BOUNDS_HI[idx]), 6)
                     if rng.random() < 0.55:
-                        chaos[DELTA_KEY] = round(rng.uniform(*DELTA_BOUNDS), 6)
-                push_candidate(normalize_profile(chaos), "chaos")
+                        chaos[DELTA_INDEX] = round(rng.uniform(*DELTA_BOUNDS), 6)
+                # Resets draw rounded in-bounds values, so chaos stays normalized.
+                push_candidate(tuple(chaos), "chaos")
 
-            attempts = 0
-            while len(candidate_specs) < args.candidates and attempts < 320:
-                attempts += 1
+            def propose_mutation() -> Tuple[ProfileVec, str]:
                 local_step = search_step * (1.0 + rng.uniform(-0.15, 0.35))
                 if stagnation_count >= 2:
                     local_step *= 1.2
@@ -550,34 +867,62 @@ def main() -> int:
                     local_step *= 1.2 + rng.uniform(-0.08, 0.32)
                     if rng.random() < 0.24:
                         profile = mutate_profile_aggressive(incumbent_profile, rng, local_step)
-                        push_candidate(profile, "mutate_aggressive")
-                    else:
-                        profile = mutate_profile(
-                            incumbent_profile,
-                            rng,
-                            local_step,
-                            min_fields=4,
-                            max_fields=len(SCALE_KEYS),
-                            delta_scale=0.18,
-                        )
-                        push_candidate(profile, "mutate")
-                else:
-                    profile = mutate_profile(incumbent_profile, rng, local_step)
-                    push_candidate(profile, "mutate")
+                        return profile, "mutate_aggressive"
+                    profile = mutate_profile(
+                        incumbent_profile,
+                        rng,
+                        local_step,
+                        min_fields=4,
+                        max_fields=len(SCALE_KEYS),
+                        delta_scale=0.18,
+                    )
+                    return profile, "mutate"
+                return mutate_profile(incumbent_profile, rng, local_step), "mutate"
+
+            # From iteration 3, once enough finite scores exist to fit on, over-generate
+            # mutations and only benchmark the ones the surrogate rates highest.
+            if (
+                args.surrogate
+                and iteration > 2
+                and len(candidate_specs) < args.candidates
+                and len(eval_cache) >= args.candidates + 1
+            ):
+                pool: Dict[ProfileVec, str] = {}
+                for _ in range(args.surrogate_pool):
+                    profile, strategy = propose_mutation()
+                    if profile not in seen:
+                        pool.setdefault(profile, strategy)
+                observed = [
+                    (vec, metric_tuple(row, args.selection_metric)[0])
+                    for vec, row in eval_cache.items()
+                ]
+                ranked = surrogate_rank(
+                    list(pool), observed, args.surrogate_kappa, args.random_seed
+                )
+                for profile in ranked:
+                    if len(candidate_specs) >= args.candidates:
+                        break
+                    push_candidate(profile, f"surrogate_{pool[profile]}")
+
+            attempts = 0
+            while len(candidate_specs) < args.candidates and attempts < 320:
+                attempts += 1
+                profile, strategy = propose_mutation()
+                push_candidate(profile, strategy)
 
             if len(candidate_specs) < args.candidates:
                 raise RuntimeError(
                     f"could not generate {args.candidates} unique candidates (got {len(candidate_specs)})"
                 )
 
-            results: List[CandidateResult] = []
-            for candidate_idx, (profile, strategy) in enumerate(candidate_specs):
+            def evaluate(candidate_idx: int, profile: ProfileVec, strategy: str) -> CandidateResult:
                 cand_dir = iter_dir / f"cand-{candidate_idx:02d}"
                 cand_dir.mkdir(parents=True, exist_ok=True)
 
-                write_json(cand_dir / "profile.json", profile)
-                write_json(active_profile_path, profile)
+                profile_path = cand_dir / "profile.json"
+                write_json(profile_path, profile_to_dict(profile), indent=None)
 
+                error = ""
                 try:
                     objective, avg_score, max_score, avg_frames = benchmark_profile(
                         binary=binary,
@@ -587,8 +932,10 @@ def main() -> int:
                         max_frames=args.max_frames,
                         jobs=args.jobs,
                         out_dir=cand_dir,
+                        profile_path=profile_path,
                     )
-                except subprocess.CalledProcessError:
+                except subprocess.CalledProcessError as exc:
+                    error = (exc.stderr or "").strip() or f"exit status {exc.returncode}"
                     objective, avg_score, max_score, avg_frames = (
                         -math.inf,
                         -math.inf,
@@ -596,7 +943,7 @@ def main() -> int:
                         0.0,
                     )
 
-                result = CandidateResult(
+                return CandidateResult(
                     iteration=iteration,
                     candidate=candidate_idx,
                     strategy=strategy,
@@ -606,16 +953,150 @@ def main() -> int:
                     avg_frames=avg_frames,
                     out_dir=str(cand_dir),
                     profile=profile,
+                    error=error,
                 )
-                results.append(result)
 
+            def report(result: CandidateResult, cached: bool = False) -> None:
                 print(
-                    f"iter={iteration:03d} cand={candidate_idx:02d} strategy={strategy} "
-                    f"objective={objective:.3f} avg_score={avg_score:.3f} "
-                    f"max_score={max_score} avg_frames={avg_frames:.2f}",
+                    f"iter={iteration:03d} cand={result.candidate:02d} strategy={result.strategy} "
+                    f"objective={result.objective_value:.3f} avg_score={result.avg_score:.3f} "
+                    f"max_score={result.max_score} avg_frames={result.avg_frames:.2f}"
+                    + (" cached=true" if cached else ""),
                     flush=True,
                 )
+                if result.error:
+                    print(
+                        f"iter={iteration:03d} cand={result.candidate:02d} benchmark failed: "
+                        f"{result.error.splitlines()[-1]}",
+                        file=sys.stderr,
+                        flush=True,
+                    )
 
+            results: List[CandidateResult] = []
+            pending: List[Tuple[int, ProfileVec, str]] = []
+            for candidate_idx, (profile, strategy) in enumerate(candidate_specs):
+                if strategy == "incumbent" and incumbent_record is not None:
+                    cached = incumbent_record
+                else:
+                    cached = eval_cache.get(profile_signature(profile))
+                if cached is None:
+                    pending.append((candidate_idx, profile, strategy))
+                    continue
+                cand_dir = iter_dir / f"cand-{candidate_idx:02d}"
+                if not cand_dir.exists():
+                    cand_dir.symlink_to(Path(cached.out_dir).resolve(), target_is_directory=True)
+                result = CandidateResult(
+                    iteration=iteration,
+                    candidate=candidate_idx,
+                    strategy=strategy,
+                    objective_value=cached.objective_value,
+                    avg_score=cached.avg_score,
+                    max_score=cached.max_score,
+                    avg_frames=cached.avg_frames,
+                    out_dir=cached.out_dir,
+                    profile=profile,
+                )
+                results.append(result)
+                report(result, cached=True)
+
+            cached_count = len(results)
+            skipped_count = 0
+
+            if pending and args.batch:
+                profiles_dir = iter_dir / "profiles"
+                for candidate_idx, profile, _ in pending:
+                    # Also keep a copy in the candidate's own output dir, like
+                    # the per-candidate path does.
+                    for path in (
+                        profiles_dir / f"cand-{candidate_idx:02d}.json",
+                        iter_dir / f"cand-{candidate_idx:02d}" / "profile.json",
+                    ):
+                        write_json(path, profile_to_dict(profile), indent=None)
+                batch_metrics, batch_error = benchmark_profile_batch(
+                    binary=binary,
+                    autopilot_root=autopilot_root,
+                    bot=args.bot,
+                    seeds_file=seeds_file,
+                    max_frames=args.max_frames,
+                    jobs=args.jobs,
+                    profiles_dir=profiles_dir,
+                    out_dir=iter_dir,
+                )
+                for candidate_idx, profile, strategy in pending:
+                    metrics = batch_metrics.get(f"cand-{candidate_idx:02d}")
+                    objective, avg_score, max_score, avg_frames = metrics or (
+                        -math.inf,
+                        -math.inf,
+                        0,
+                        0.0,
+                    )
+                    result = CandidateResult(
+                        iteration=iteration,
+                        candidate=candidate_idx,
+                        strategy=strategy,
+                        objective_value=objective,
+                        avg_score=avg_score,
+                        max_score=max_score,
+                        avg_frames=avg_frames,
+                        out_dir=str(iter_dir / f"cand-{candidate_idx:02d}"),
+                        profile=profile,
+                        error="" if metrics else batch_error,
+                    )
+                    results.append(result)
+                    report(result)
+                    if math.isfinite(result.objective_value):
+                        eval_cache[profile_signature(result.profile)] = result
+            elif pending:
+                # Cached rows seed the running best but do not count toward the
+                # early-stop streak; only real benchmarks are worth saving.
+                best_so_far = max(
+                    results,
+                    key=lambda row: metric_tuple(row, args.selection_metric),
+                    default=None,
+                )
+                streak = 0
+                # Keep at most `workers` benchmarks in flight so an early stop can
+                # still skip the candidates that have not been submitted yet.
+                next_idx = 0
+                in_flight = set()
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    while next_idx < len(pending) or in_flight:
+                        while next_idx < len(pending) and len(in_flight) < workers:
+                            in_flight.add(executor.submit(evaluate, *pending[next_idx]))
+                            next_idx += 1
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            result = future.result()
+                            results.append(result)
+                            report(result)
+                            if math.isfinite(result.objective_value):
+                                eval_cache[profile_signature(result.profile)] = result
+
+                            if not early_stop or next_idx >= len(pending):
+                                continue
+                            if best_so_far is None or beats_by_epsilon(result, best_so_far):
+                                best_so_far = result
+                                streak = 0
+                                continue
+                            streak += 1
+                            if streak >= early_stop:
+                                skipped_count = len(pending) - next_idx
+                                next_idx = len(pending)
+                                print(
+                                    f"iter={iteration:03d} early stop: {streak} candidates "
+                                    f"without improvement, skipping {skipped_count} more",
+                                    flush=True,
+                                )
+
+            # Keep tie ordering independent of completion order.
+            results.sort(key=lambda row: row.candidate)
+            if es is not None:
+                # cma minimizes; candidate i was generated from cma_solutions[i].
+                fitness = []
+                for row in results[: len(cma_solutions)]:
+                    value = metric_tuple(row, args.selection_metric)[0]
+                    fitness.append(-value if math.isfinite(value) else sys.float_info.max)
+                es.tell(cma_solutions, fitness)
             results.sort(
                 key=lambda row: metric_tuple(row, args.selection_metric), reverse=True
             )
@@ -624,30 +1105,56 @@ def main() -> int:
             winner = results[0]
             incumbent_result = next(r for r in results if r.strategy == "incumbent")
             improved = better_than(winner, incumbent_result, args.selection_metric)
+            annealed = False
 
             if improved:
-                previous = dict(incumbent_profile)
-                incumbent_profile = dict(winner.profile)
+                previous = incumbent_profile
+                incumbent_profile = winner.profile
+                incumbent_record = winner
                 momentum = profile_delta(incumbent_profile, previous)
                 last_gain_anchor = previous
                 stagnation_count = 0
             else:
                 stagnation_count += 1
+                if math.isfinite(incumbent_result.objective_value):
+                    incumbent_record = incumbent_result
+                # Metropolis step: let the walk follow the best challenger downhill
+                # while global_best_profile keeps the argmax seen so far.
+                challenger = next((r for r in results if r.strategy != "incumbent"), None)
+                if challenger is not None:
+                    delta = (
+                        metric_tuple(challenger, args.selection_metric)[0]
+                        - metric_tuple(incumbent_result, args.selection_metric)[0]
+                    )
+                    if metropolis_accept(delta, temperature, rng):
+                        annealed = True
+                        last_gain_anchor = incumbent_profile
+                        incumbent_profile = challenger.profile
+                        incumbent_record = challenger
+                        momentum = None
 
             if global_best_result is None or better_than(
                 winner, global_best_result, args.selection_metric
             ):
                 global_best_result = winner
-                global_best_profile = dict(winner.profile)
+                global_best_profile = winner.profile
 
-            write_json(iter_dir / "winner-profile.json", incumbent_profile)
+            write_json(
+                iter_dir / "winner-profile.json", profile_to_dict(incumbent_profile), indent=None
+            )
+            write_json(active_profile_path, profile_to_dict(incumbent_profile), atomic=True)
+            write_eval_cache(session_dir / "eval-cache.json", eval_cache_context, eval_cache)
 
             history.append(
                 {
                     "iteration": iteration,
                     "base_step": base_step,
                     "search_step": search_step,
+                    "temperature": temperature,
                     "improved": improved,
+                    "annealed": annealed,
+                    "cached_candidates": cached_count,
+                    "skipped_candidates": skipped_count,
                     "stagnation_count": stagnation_count,
                     "winner": {
                         "candidate": winner.candidate,
@@ -663,15 +1170,17 @@ def main() -> int:
             print(
                 f"iter={iteration:03d} winner=cand-{winner.candidate:02d} ({winner.strategy}) "
                 f"objective={winner.objective_value:.3f} avg_score={winner.avg_score:.3f} "
-                f"improved={improved} stagnation={stagnation_count}",
+                f"improved={improved} annealed={annealed} T={temperature:.3f} "
+                f"stagnation={stagnation_count}",
                 flush=True,
             )
 
         if global_best_result is None:
             raise RuntimeError("no candidates were evaluated")
 
-        write_json(session_dir / "champion.json", global_best_profile)
-        write_json(champion_profile_path, global_best_profile)
+        champion_dict = profile_to_dict(global_best_profile)
+        write_json(session_dir / "champion.json", champion_dict)
+        write_json(champion_profile_path, champion_dict, atomic=True)
 
         summary = {
             "session": session_name,
@@ -680,11 +1189,18 @@ def main() -> int:
             "candidates": args.candidates,
             "max_frames": args.max_frames,
             "jobs": args.jobs,
+            "workers": workers,
+            "batch": args.batch,
             "selection_metric": args.selection_metric,
             "anchor_mode": args.anchor_mode,
+            "strategy": args.strategy,
+            "surrogate": args.surrogate,
+            "early_stop": early_stop,
             "install_mode": args.install_mode,
             "seeds_file": str(seeds_file),
             "random_seed": args.random_seed,
+            "initial_temp": args.initial_temp,
+            "cooling": args.cooling,
             "start_profile": str(start_profile_path),
             "best": {
                 "objective_value": global_best_result.objective_value,
@@ -695,15 +1211,15 @@ def main() -> int:
                 "candidate": global_best_result.candidate,
                 "strategy": global_best_result.strategy,
             },
-            "champion_profile": global_best_profile,
+            "champion_profile": champion_dict,
             "history": history,
         }
         write_json(session_dir / "summary.json", summary)
 
         if args.install_mode == "champion":
-            write_json(active_profile_path, global_best_profile)
+            write_json(active_profile_path, champion_dict, atomic=True)
         else:
-            write_json(active_profile_path, old_profile)
+            write_json(active_profile_path, profile_to_dict(old_profile), atomic=True)
 
         (lab_root / "runs" / "latest-session.txt").write_text(f"{session_dir}\n")
 
@@ -715,7 +1231,7 @@ def main() -> int:
         return 0
     finally:
         if not success:
-            write_json(active_profile_path, old_profile)
+            write_json(active_profile_path, profile_to_dict(old_profile), atomic=True)
 
 
 if __name__ == "__main__":
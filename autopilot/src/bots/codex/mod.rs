@@ -14,6 +14,8 @@ use asteroids_verifier_core::sim::{AsteroidSizeSnapshot, BulletSnapshot, WorldSn
 use asteroids_verifier_core::tape::{decode_input_byte, FrameInput};
 use serde::{Deserialize, Serialize};
 use std::fs;
+use std::path::PathBuf;
+use std::sync::RwLock;
 
 const TORUS_SHIFTS_X_Q12_4: [i32; 3] = [-WORLD_WIDTH_Q12_4, 0, WORLD_WIDTH_Q12_4];
 const TORUS_SHIFTS_Y_Q12_4: [i32; 3] = [-WORLD_HEIGHT_Q12_4, 0, WORLD_HEIGHT_Q12_4];
@@ -26,6 +28,8 @@ const ENDGAME_FRAME_CAP: i32 = 108_000;
 const ENDGAME_PUSH_START_FRAME: i32 = 72_000;
 /// Path relative to the autopilot crate root (CARGO_MANIFEST_DIR).
 const ADAPTIVE_PROFILE_REL_PATH: &str = "codex-/state/adaptive-profile.json";
+/// Optional per-process override for the adaptive profile (set via `benchmark --adaptive-profile`).
+static ADAPTIVE_PROFILE_OVERRIDE: RwLock<Option<PathBuf>> = RwLock::new(None);
 
 #[derive(Clone, Copy, Debug)]
 struct PredictedShip {
@@ -362,9 +366,26 @@ pub(super) fn default_adaptive_profile() -> AdaptiveProfile {
     }
 }
 
+/// Point `codex-potential-adaptive` at a profile other than the shared state file.
+/// Lets independent benchmark processes evaluate different profiles concurrently.
+pub fn set_adaptive_profile_path(path: Option<PathBuf>) {
+    let mut guard = ADAPTIVE_PROFILE_OVERRIDE
+        .write()
+        .unwrap_or_else(|poisoned| poisoned.into_inner());
+    *guard = path;
+}
+
+fn adaptive_profile_path() -> PathBuf {
+    let guard = ADAPTIVE_PROFILE_OVERRIDE
+        .read()
+        .unwrap_or_else(|poisoned| poisoned.into_inner());
+    guard.clone().unwrap_or_else(|| {
+        std::path::Path::new(env!("CARGO_MANIFEST_DIR")).join(ADAPTIVE_PROFILE_REL_PATH)
+    })
+}
+
 pub(super) fn load_adaptive_profile() -> AdaptiveProfile {
-    let path = std::path::Path::new(env!("CARGO_MANIFEST_DIR")).join(ADAPTIVE_PROFILE_REL_PATH);
-    let Ok(raw) = fs::read_to_string(path) else {
+    let Ok(raw) = fs::read_to_string(adaptive_profile_path()) else {
         return default_adaptive_profile();
     };
     serde_json::from_str::<AdaptiveProfile>(&raw).unwrap_or_else(|_| default_adaptive_profile())
@@ -2237,6 +2258,8 @@ pub(super) fn codex_manifest_entries() -> Vec<(&'static str, &'static str, serde
         adaptive_profile,
     ))
     .expect("adaptive potential config should serialize");
+    // Always the canonical path: this feeds the config hash, and a profile loaded
+    // via --adaptive-profile must fingerprint the same as the identical default.
     adaptive_cfg["adaptive_profile_path"] =
         serde_json::Value::String(ADAPTIVE_PROFILE_REL_PATH.to_string());
     adaptive_cfg["adaptive_profile"] =
@@ -2271,6 +2271,7 @@ fn search_bot_configs() -> &'static [SearchConfig] {
 mod codex;
 mod roster;
 
+pub use codex::set_adaptive_profile_path;
 pub use roster::{bot_ids, create_bot, describe_bots};
 
 pub fn bot_fingerprint(id: &str) -> Option<String> {
@@ -2,8 +2,12 @@ use anyhow::{anyhow, Result};
 use asteroids_verifier_core::tape::parse_tape;
 use asteroids_verifier_core::verify_tape;
 use clap::{Parser, Subcommand, ValueEnum};
-use rust_autopilot::benchmark::{resolve_bots, run_benchmark, BenchmarkConfig, Objective};
-use rust_autopilot::bots::{bot_ids, bot_manifest_entries, create_bot, describe_bots};
+use rust_autopilot::benchmark::{
+    resolve_bots, run_benchmark, BenchmarkConfig, BenchmarkReport, Objective,
+};
+use rust_autopilot::bots::{
+    bot_ids, bot_manifest_entries, create_bot, describe_bots, set_adaptive_profile_path,
+};
 use rust_autopilot::claude::lab::{run_multi_generation, EvolvedConfig};
 use rust_autopilot::codex_lab::{collect_run_intel, default_codex_output_dir, run_learning_cycle};
 use rust_autopilot::runner::{run_bot, write_tape};
@@ -71,6 +75,13 @@ enum Commands {
         save_top: usize,
         #[arg(long)]
         jobs: Option<usize>,
+        /// Adaptive profile JSON for codex-potential-adaptive (defaults to codex-/state)
+        #[arg(long)]
+        adaptive_profile: Option<PathBuf>,
+        /// Benchmark every adaptive profile JSON in this directory in one process,
+        /// writing each report to <out-dir>/<profile stem>
+        #[arg(long, conflicts_with = "adaptive_profile")]
+        profiles_dir: Option<PathBuf>,
     },
     /// Collect rich per-frame run intel for one bot/seed (death causes + shot outcomes)
     CodexIntelRun {
@@ -210,7 +221,15 @@ fn main() -> Result<()> {
             out_dir,
             save_top,
             jobs,
+            adaptive_profile,
+            profiles_dir,
         } => {
+            if let Some(path) = adaptive_profile.as_ref() {
+                if !path.exists() {
+                    return Err(anyhow!("adaptive profile not found: {}", path.display()));
+                }
+            }
+            set_adaptive_profile_path(adaptive_profile);
             let bots = resolve_bots(bots.as_deref())?;
             let seeds = resolve_seeds(
                 seeds.as_deref(),
@@ -228,7 +247,7 @@ fn main() -> Result<()> {
                 ))
             });
 
-            let report = run_benchmark(BenchmarkConfig {
+            let config = BenchmarkConfig {
                 bots,
                 seeds,
                 max_frames,
@@ -236,7 +255,12 @@ fn main() -> Result<()> {
                 out_dir: out_dir.clone(),
                 save_top,
                 jobs,
-            })?;
+            };
+            if let Some(profiles_dir) = profiles_dir {
+                return run_profile_batch(&profiles_dir, config);
+            }
+
+            let report = run_benchmark(config)?;
 
             println!("objective={}", objective.as_str());
             println!("runs={}", report.run_count);
@@ -278,6 +302,8 @@ fn main() -> Result<()> {
                     tape.lives,
                 );
             }
+
+            print_result_lines(&report, None);
         }
         Commands::CodexIntelRun {
             bot,
@@ -444,6 +470,66 @@ fn main() -> Result<()> {
     Ok(())
 }
 
+/// Machine-readable per-bot aggregates (parsed by codex-tuner).
+fn print_result_lines(report: &BenchmarkReport, profile: Option<&str>) {
+    let prefix = profile
+        .map(|stem| format!("profile={stem} "))
+        .unwrap_or_default();
+    for bot in &report.bot_rankings {
+        println!(
+            "RESULT {prefix}bot={} objective={} avg_score={} max_score={} avg_frames={}",
+            bot.bot_id, bot.objective_value, bot.avg_score, bot.max_score, bot.avg_frames,
+        );
+    }
+}
+
+/// Benchmark each `*.json` adaptive profile in `profiles_dir` within one process,
+/// so callers pay binary startup once per batch instead of once per profile.
+fn run_profile_batch(profiles_dir: &Path, base: BenchmarkConfig) -> Result<()> {
+    let mut profiles: Vec<PathBuf> = fs::read_dir(profiles_dir)
+        .map_err(|err| anyhow!("failed reading {}: {err}", profiles_dir.display()))?
+        .filter_map(|entry| entry.ok().map(|entry| entry.path()))
+        .filter(|path| path.extension().is_some_and(|ext| ext == "json"))
+        .collect();
+    profiles.sort();
+    if profiles.is_empty() {
+        return Err(anyhow!(
+            "no profile JSON files found in {}",
+            profiles_dir.display()
+        ));
+    }
+
+    let mut failed = 0usize;
+    for profile in &profiles {
+        let stem = profile
+            .file_stem()
+            .and_then(|stem| stem.to_str())
+            .unwrap_or("profile")
+            .to_string();
+        let out_dir = base.out_dir.join(&stem);
+        set_adaptive_profile_path(Some(profile.clone()));
+        match run_benchmark(BenchmarkConfig {
+            out_dir: out_dir.clone(),
+            ..base.clone()
+        }) {
+            Ok(report) => {
+                println!("profile={stem} out_dir={}", out_dir.display());
+                print_result_lines(&report, Some(&stem));
+            }
+            Err(err) => {
+                failed += 1;
+                eprintln!("profile={stem} error={err:#}");
+            }
+        }
+    }
+    set_adaptive_profile_path(None);
+
+    if failed > 0 {
+        return Err(anyhow!("{failed} of {} profiles failed", profiles.len()));
+    }
+    Ok(())
+}
+
 fn resolve_seeds(
     seeds: Option<&str>,
     seed_file: Option<&Path>,